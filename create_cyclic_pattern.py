@@ -1,5 +1,16 @@
-import argparse
-import string
+import sys
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from itertools import islice, product
+
+# Largest `num_patterns` whose result is memoized.
+_RESULT_CACHE_LIMIT = 4096
+
+# Upper bound on the number of precomputed suffix strings in the lookup table.
+_SUFFIX_TABLE_LIMIT = 4096
+
+# Number of patterns the CLI joins into a single write.
+_OUTPUT_CHUNK_SIZE = 4096
 
 def create_cyclic_pattern(input_charset: str, num_patterns: int, pattern_length: int) -> list[str]:
     """
@@ -18,60 +29,235 @@ def create_cyclic_pattern(input_charset: str, num_patterns: int, pattern_length:
 
     Returns:
         A list of strings, where each string is a created pattern.
-        Returns an empty list if input validation fails.
+
+    Raises:
+        ValueError: If `input_charset` is empty or `num_patterns` or
+                    `pattern_length` is not positive.
+    """
+    patterns = _patterns(input_charset, num_patterns, pattern_length)
+    # Cached results are shared tuples; hand each caller its own list.
+    return patterns if isinstance(patterns, list) else list(patterns)
+
+def create_cyclic_pattern_tuple(input_charset: str, num_patterns: int, pattern_length: int) -> tuple[str, ...]:
+    """
+    creates the same cyclic patterns as `create_cyclic_pattern`, as a tuple.
+
+    The tuple is exactly sized, unlike a list with its spare capacity, and
+    small results are returned straight from the cache without copying, so
+    the same tuple may be shared with other callers. Use this when the
+    patterns are only read (e.g. test fixtures).
+
+    Args:
+        input_charset: A string containing the unique characters to use for
+                       generating patterns (e.g., "ABC", "01").
+        num_patterns: The total number of patterns to create.
+        pattern_length: The fixed length of each created pattern.
+
+    Returns:
+        A tuple of strings, where each string is a created pattern.
+
+    Raises:
+        ValueError: If `input_charset` is empty or `num_patterns` or
+                    `pattern_length` is not positive.
+    """
+    patterns = _patterns(input_charset, num_patterns, pattern_length)
+    return patterns if isinstance(patterns, tuple) else tuple(patterns)
+
+def iter_cyclic_pattern(input_charset: str, pattern_length: int) -> Iterator[str]:
+    """
+    Lazily yields the same cyclic patterns as `create_cyclic_pattern`.
+
+    The generator never ends on its own: once every combination has been
+    produced it wraps around to the first pattern again. Use
+    `itertools.islice` to take a fixed number of patterns without holding
+    them all in memory.
+
+    Args:
+        input_charset: A string containing the unique characters to use for
+                       generating patterns (e.g., "ABC", "01").
+        pattern_length: The fixed length of each created pattern.
+
+    Returns:
+        An endless iterator over the created patterns.
+
+    Raises:
+        ValueError: If `input_charset` is empty or `pattern_length` is not
+                    positive.
+    """
+    # Validate eagerly, before handing back the (lazy) generator.
+    _validate_charset(input_charset)
+    _validate_length(pattern_length)
+    return _cycle_patterns(input_charset, pattern_length)
+
+def create_cyclic_pattern_columns(input_charset: str, num_patterns: int, pattern_length: int) -> list[str]:
+    """
+    creates the same cyclic patterns as `create_cyclic_pattern`, column by column.
+
+    Instead of one string per pattern, this returns one string per character
+    position: `columns[k][r]` is the `k`-th character of the `r`-th pattern.
+    Callers that scan a single position across every pattern get it as one
+    contiguous string instead of walking `num_patterns` separate objects.
+
+    Args:
+        input_charset: A string containing the unique characters to use for
+                       generating patterns (e.g., "ABC", "01").
+        num_patterns: The total number of patterns to create.
+        pattern_length: The fixed length of each created pattern.
+
+    Returns:
+        A list of `pattern_length` strings, each `num_patterns` characters long.
+
+    Raises:
+        ValueError: If `input_charset` is empty or `num_patterns` or
+                    `pattern_length` is not positive.
     """
     # --- Input Validation ---
-    if not input_charset:
-        print("Error: Character set cannot be empty.")
-        return []
+    _validate_arguments(input_charset, num_patterns, pattern_length)
+
+    # --- Column Generation ---
+    # Column k holds each character repeated base**(pattern_length-1-k) times,
+    # cycling through the charset. Columns are built right to left, growing
+    # the run length by one factor of `base` per step. Once a run covers all
+    # `num_patterns` rows, every column further left is the first character
+    # repeated, so the run length never grows past `num_patterns`.
+    columns: list[str] = []
+    run = 1
+    while len(columns) < pattern_length and run < num_patterns:
+        runs_needed = -(-num_patterns // run)
+        period = "".join(char * run for char in input_charset[:runs_needed])
+        columns.append((period * -(-num_patterns // len(period)))[:num_patterns])
+        run *= len(input_charset)
+    columns.extend([input_charset[0] * num_patterns] * (pattern_length - len(columns)))
+    columns.reverse()
+    return columns
+
+def _validate_arguments(input_charset: str, num_patterns: int, pattern_length: int) -> None:
+    """Raises ValueError for an empty charset or a non-positive count or length."""
+    _validate_charset(input_charset)
     if num_patterns <= 0:
-        print("Error: Number of patterns must be a positive integer.")
-        return []
+        raise ValueError("Number of patterns must be a positive integer.")
+    _validate_length(pattern_length)
+
+def _validate_charset(input_charset: str) -> None:
+    """Raises ValueError if `input_charset` is empty."""
+    if not input_charset:
+        raise ValueError("Character set cannot be empty.")
+
+def _validate_length(pattern_length: int) -> None:
+    """Raises ValueError if `pattern_length` is not positive."""
     if pattern_length <= 0:
-        print("Error: Pattern length must be a positive integer.")
-        return []
+        raise ValueError("Pattern length must be a positive integer.")
+
+def _patterns(input_charset: str, num_patterns: int, pattern_length: int) -> Sequence[str]:
+    """
+    Validates the arguments and returns the patterns for the list and tuple APIs.
+
+    The result is either a memoized tuple, which must not be handed out as a
+    list, or a freshly built list owned by the caller.
+    """
+    # --- Input Validation ---
+    _validate_arguments(input_charset, num_patterns, pattern_length)
+
+    # --- Pattern Generation ---
+    # Fast path: only the last character changes, so there is never a carry.
+    if num_patterns <= len(input_charset):
+        prefix = input_charset[0] * (pattern_length - 1)
+        return [prefix + char for char in input_charset[:num_patterns]]
+
+    # Small results are memoized as immutable tuples.
+    if num_patterns <= _RESULT_CACHE_LIMIT:
+        return _cached_patterns(input_charset, num_patterns, pattern_length)
+
+    # Large results are built directly and never cached, so their memory is
+    # released as soon as the caller drops them.
+    return _generate_patterns(input_charset, num_patterns, pattern_length)
 
-    # --- Initialization ---
+@lru_cache(maxsize=32)
+def _cached_patterns(input_charset: str, num_patterns: int, pattern_length: int) -> tuple[str, ...]:
+    """
+    Generates and memoizes small results for `_patterns`.
+
+    Repeated calls with the same arguments (e.g. test fixtures using a fixed
+    alphabet) return the previously generated tuple immediately.
+    """
+    return tuple(_generate_patterns(input_charset, num_patterns, pattern_length))
+
+def _generate_patterns(input_charset: str, num_patterns: int, pattern_length: int) -> list[str]:
+    """Generates the first `num_patterns` cyclic patterns as a list."""
+    # Patterns are produced in odometer order (rightmost "digit" fastest),
+    # so islice just takes the first patterns of a single cycle.
+    cycle_length = len(input_charset) ** pattern_length
+    if num_patterns <= cycle_length:
+        return list(islice(_one_cycle(input_charset, pattern_length), num_patterns))
+
+    # The sequence wraps around: build one full cycle, then let list
+    # repetition copy it (sharing the same string objects) in C.
+    full_cycles, remainder = divmod(num_patterns, cycle_length)
+    one_cycle = list(_one_cycle(input_charset, pattern_length))
+    return one_cycle * full_cycles + one_cycle[:remainder]
+
+def _cycle_patterns(input_charset: str, pattern_length: int) -> Iterator[str]:
+    """Yields cyclic patterns forever, wrapping around after each full cycle."""
+    while True:
+        yield from _one_cycle(input_charset, pattern_length)
+
+def _one_cycle(input_charset: str, pattern_length: int) -> Iterator[str]:
+    """
+    Yields every pattern of `pattern_length` characters exactly once, in order.
+
+    The rightmost characters are looked up in a precomputed table of suffix
+    strings, so each pattern costs a single concatenation of a prefix and a
+    table entry rather than a join over `pattern_length` characters.
+    """
     base = len(input_charset)
-    # This list holds the indices for the characters in the current pattern.
-    # We start at all zeros (e.g., [0, 0, 0, 0] for 'AAAA').
-    indices = [0] * pattern_length
-    created_patterns = []
-
-    # --- Pattern Generation Loop ---
-    for _ in range(num_patterns):
-        # 1. Build the current pattern string from the indices.
-        current_pattern = "".join([input_charset[i] for i in indices])
-        created_patterns.append(current_pattern)
-
-        # 2. Increment the indices for the next pattern (like base-26 counting).
-        # Start from the rightmost "digit".
-        for i in range(pattern_length - 1, -1, -1):
-            indices[i] += 1
-            # If the index is still within the bounds of our charset,
-            # we're done incrementing for this pattern.
-            if indices[i] < base:
-                break
-            # Otherwise, reset this index to 0 and carry over to the left.
-            else:
-                indices[i] = 0
-
-    return created_patterns
+    suffix_length = 1
+    while (suffix_length < pattern_length
+           and base ** (suffix_length + 1) <= _SUFFIX_TABLE_LIMIT):
+        suffix_length += 1
+
+    suffixes = _suffix_table(input_charset, suffix_length)
+    prefixes = map("".join, product(input_charset, repeat=pattern_length - suffix_length))
+    for prefix in prefixes:
+        for suffix in suffixes:
+            yield prefix + suffix
+
+@lru_cache(maxsize=32)
+def _suffix_table(input_charset: str, suffix_length: int) -> tuple[str, ...]:
+    """Returns every string of `suffix_length` characters, in odometer order."""
+    return tuple(map("".join, product(input_charset, repeat=suffix_length)))
 
 # --- Command-Line Interface ---
-if __name__ == '__main__':
+def _positive_int(value: str) -> int:
+    """Argument type for argparse that only accepts positive integers."""
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+def _main() -> None:
+    """Runs the command-line interface."""
+    # argparse and string (which pulls in re) are only needed by the CLI, so
+    # they are imported here to keep `import create_cyclic_pattern` cheap.
+    import argparse
+    import string
+
     parser = argparse.ArgumentParser(
         description="create a sequence of cyclic patterns using the alphabet.\n"
                     "Example usage: python your_script_name.py 3 4"
     )
     parser.add_argument(
         "num_patterns",
-        type=int,
+        type=_positive_int,
         help="The total number of patterns to create."
     )
     parser.add_argument(
         "pattern_length",
-        type=int,
+        type=_positive_int,
         help="The fixed length of each pattern."
     )
 
@@ -80,13 +266,23 @@ if __name__ == '__main__':
     # The character set is now fixed to the uppercase alphabet.
     alphabet_charset = string.ascii_uppercase
 
-    # create the requested number of patterns.
-    patterns = create_cyclic_pattern(
-        input_charset=alphabet_charset,
-        num_patterns=args.num_patterns,
-        pattern_length=args.pattern_length
+    # Stream the requested number of patterns instead of building a list.
+    patterns = islice(
+        iter_cyclic_pattern(
+            input_charset=alphabet_charset,
+            pattern_length=args.pattern_length
+        ),
+        args.num_patterns
     )
 
     # Print the resulting patterns on a single line, separated by spaces.
-    if patterns:
-        print(" ".join(patterns))
+    # Joining a chunk at a time keeps memory bounded while paying the
+    # per-write overhead once per chunk instead of once per pattern.
+    sys.stdout.write(next(patterns))
+    while chunk := list(islice(patterns, _OUTPUT_CHUNK_SIZE)):
+        sys.stdout.write(" ")
+        sys.stdout.write(" ".join(chunk))
+    sys.stdout.write("\n")
+
+if __name__ == '__main__':
+    _main()